@@ -3,10 +3,10 @@ from dataclasses import dataclass
 import time
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DensityPacket:
     text: str
-    tags: list
+    tags: tuple  # tuple, not list: frozen packets must stay hashable
     timestamp: float
     weight: float  # a simple “entropy pressure” proxy
 
@@ -25,7 +25,7 @@ class BackgroundDensity:
     def ingest(self, text: str, tags: list):
         # Simple weight heuristic: length + number of tags
         weight = min(1.0, (len(text) / 280.0) + (0.05 * len(tags)))
-        self.queue.append(DensityPacket(text=text, tags=tags, timestamp=time.time(), weight=weight))
+        self.queue.append(DensityPacket(text=text, tags=tuple(tags), timestamp=time.time(), weight=weight))
 
     def should_promote(self, coherence_score: float | None) -> bool:
         if coherence_score is None:
@@ -69,5 +69,5 @@ class BackgroundDensity:
         return {
             "queue_len": len(self.queue),
             "working_len": len(self.working_set),
-            "last_queue_item_tags": (self.queue[-1].tags if self.queue else []),
+            "last_queue_item_tags": (list(self.queue[-1].tags) if self.queue else []),
         }
\ No newline at end of file
@@ -10,6 +10,10 @@ class Development:
     def __init__(self):
         self.index = 0
 
+    @property
+    def stage(self) -> str:
+        return self.STAGES[self.index]
+
     def update(self, memory: "Memory"):
         if len(memory.entries) > (self.index + 1) * 5:
             self.index = min(self.index + 1, len(self.STAGES) - 1)
@@ -17,5 +21,5 @@ class Development:
     def panel(self) -> str:
         return f"""
 **Development**
-- Stage: {self.STAGES[self.index]}
+- Stage: {self.stage}
 """
\ No newline at end of file
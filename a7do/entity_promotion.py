@@ -17,15 +17,13 @@ class Entity:
 class EntityPromotionBridge:
     def __init__(self):
         self.entities: Dict[str, Entity] = {}
+        self.by_name: Dict[str, Entity] = {}   # lowercased name -> entity
 
     def find_entity(self, name: str) -> Optional[Entity]:
         name = (name or "").strip().lower()
         if not name:
             return None
-        for e in self.entities.values():
-            if e.name.lower() == name:
-                return e
-        return None
+        return self.by_name.get(name)
 
     def confirm_entity(self, name: str, kind: str, confidence: float = 1.0, origin: str = "declarative") -> Entity:
         name = (name or "").strip()
@@ -47,4 +45,5 @@ class EntityPromotionBridge:
             origin=origin,
         )
         self.entities[ent.entity_id] = ent
+        self.by_name[name.lower()] = ent
         return ent
\ No newline at end of file
@@ -14,9 +14,13 @@ def build_brain_dot(mind) -> str:
     lines.append('node [shape=ellipse, style="filled", fillcolor="white"];')
 
     # clusters
+    # resolve entity node ids once; edges below look them up by entity id
+    ents = mind.bridge.entities
+    ent_nid = {eid: f'ent_{e.entity_id[:8]}' for eid, e in ents.items()}
+
     lines.append('subgraph cluster_entities { label="Entities"; style="rounded";')
-    for e in mind.bridge.entities.values():
-        nid = f'ent_{e.entity_id[:8]}'
+    for eid, e in ents.items():
+        nid = ent_nid[eid]
         label = f'{esc(e.name)}\\n({e.kind})\\nconf={e.confidence:.2f}'
         lines.append(f'"{nid}" [shape=oval, fillcolor="lightblue", label="{label}"];')
     lines.append('}')
@@ -55,24 +59,20 @@ def build_brain_dot(mind) -> str:
 
     # edges: relationships
     for r in mind.relationships.relations:
-        a = mind.bridge.entities.get(r.subject_id)
-        b = mind.bridge.entities.get(r.object_id)
-        if not a or not b:
+        na = ent_nid.get(r.subject_id)
+        nb = ent_nid.get(r.object_id)
+        if not na or not nb:
             continue
-        na = f'ent_{a.entity_id[:8]}'
-        nb = f'ent_{b.entity_id[:8]}'
         lines.append(f'"{na}" -> "{nb}" [label="{esc(r.rel_type)}", color="gray40"];')
 
     # edges: ownership + attachment + location
     for o in mind.objects.objects.values():
         no = f'obj_{o.object_id[:8]}'
-        if o.owner_entity_id and o.owner_entity_id in mind.bridge.entities:
-            e = mind.bridge.entities[o.owner_entity_id]
-            ne = f'ent_{e.entity_id[:8]}'
+        ne = ent_nid.get(o.owner_entity_id)
+        if ne:
             lines.append(f'"{ne}" -> "{no}" [label="owns", color="goldenrod4"];')
-        if o.attached_to and o.attached_to in mind.bridge.entities:
-            e = mind.bridge.entities[o.attached_to]
-            ne = f'ent_{e.entity_id[:8]}'
+        ne = ent_nid.get(o.attached_to)
+        if ne:
             lines.append(f'"{ne}" -> "{no}" [label="has", color="sienna4"];')
         if o.location:
             lines.append(f'"{no}" -> "place_{esc(o.location)}" [label="last_place", color="darkgreen"];')
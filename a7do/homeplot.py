@@ -1,66 +1,55 @@
+import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Tuple
 
 @dataclass
-class PlaceProfile:
+class Room:
     name: str
-    level: int = 0
-    purpose: str = "room"
-    features: List[str] = field(default_factory=list)  # bed, window, curtains
-    sounds: List[str] = field(default_factory=list)    # hum, quiet
-    smells: List[str] = field(default_factory=list)    # clean, soap
+    width: float   # metres
+    length: float  # metres
     wall_colour: str = "neutral"
     windows: int = 1
+    features: List[str] = field(default_factory=list)  # bed, window, curtains
 
 @dataclass
-class PersonProfile:
-    name: str
-    role: str  # mum, dad, caregiver
-    voice: str = "soft"
-    typical_actions: List[str] = field(default_factory=list)
-
-@dataclass
-class AnimalProfile:
-    name: str
-    species: str
-    temperament: str = "calm"
-    sounds: List[str] = field(default_factory=list)
-
-@dataclass
-class ObjectProfile:
-    name: str
-    category: str  # toy, furniture, tool, container
-    attributes: List[str] = field(default_factory=list)   # red, round
-    affordances: List[str] = field(default_factory=list)  # roll, throw, catch
-    container_of: Optional[str] = None  # if this object is a container, what it can hold
-
-@dataclass
-class WorldProfiles:
+class HomePlot:
     """
-    Observer-controlled reality catalog.
-    A7DO never edits this directly.
+    Seeded home scaffold.
+    Rooms are the only places scheduled events may happen in.
     """
-
-    def __init__(self):
-        self.places: Dict[str, PlaceProfile] = {}
-        self.people: Dict[str, PersonProfile] = {}
-        self.animals: Dict[str, AnimalProfile] = {}
-        self.objects: Dict[str, ObjectProfile] = {}
-
-        # home scaffold settings
-        self.home_seed: int = 42
-        self.home_generated: bool = False
-
-    def has_parents(self) -> bool:
-        roles = {p.role.lower() for p in self.people.values()}
-        return ("mum" in roles) and ("dad" in roles)
-
-    def snapshot(self):
-        return {
-            "home_seed": self.home_seed,
-            "home_generated": self.home_generated,
-            "places": list(self.places.keys()),
-            "people": [f"{p.name} ({p.role})" for p in self.people.values()],
-            "animals": [f"{a.name} ({a.species})" for a in self.animals.values()],
-            "objects": [f"{o.name} ({o.category})" for o in self.objects.values()],
-        }
\ No newline at end of file
+    seed: int
+    rooms: Dict[str, Room] = field(default_factory=dict)
+    doors: List[Tuple[str, str]] = field(default_factory=list)
+
+# room -> (min size m, max size m, fixed features)
+ROOM_LAYOUT = {
+    "hall": (2.0, 4.0, ["front door", "stairs"]),
+    "kitchen": (3.0, 5.0, ["table", "sink", "fridge"]),
+    "living_room": (4.0, 6.0, ["sofa", "rug", "tv"]),
+    "bathroom": (2.0, 3.0, ["bath", "sink"]),
+    "bedroom_1": (3.0, 4.5, ["cot", "curtains"]),
+    "bedroom_2": (3.0, 4.5, ["bed", "wardrobe"]),
+}
+
+WALL_COLOURS = ["white", "cream", "pale blue", "pale green", "grey"]
+
+def generate_default_home(seed: int = 42) -> HomePlot:
+    """
+    Same seed -> same home. Every room opens off the hall.
+    """
+    rng = random.Random(seed)
+    home = HomePlot(seed=seed)
+
+    for name, (lo, hi, features) in ROOM_LAYOUT.items():
+        home.rooms[name] = Room(
+            name=name,
+            width=round(rng.uniform(lo, hi), 1),
+            length=round(rng.uniform(lo, hi), 1),
+            wall_colour=rng.choice(WALL_COLOURS),
+            windows=0 if name == "hall" else rng.randint(1, 2),
+            features=list(features),
+        )
+        if name != "hall":
+            home.doors.append(("hall", name))
+
+    return home
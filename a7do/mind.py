@@ -1,3 +1,7 @@
+import itertools
+import threading
+import uuid
+from collections import deque
 from typing import Dict, Any
 from a7do.experience import ExperienceStore
 from a7do.lexicon import Lexicon
@@ -14,7 +18,7 @@ class A7DOMind:
     Observer can see full trace; A7DO cannot.
     """
 
-    def __init__(self, schedule, world):
+    def __init__(self, schedule, world, trace_limit: int = 500):
         self.schedule = schedule
         self.world = world
 
@@ -27,12 +31,28 @@ class A7DOMind:
         self.last_coherence = None
         self.last_sleep_report = None
 
-        # observer trace buffer
-        self.trace = []
+        # observer trace buffer (bounded; oldest steps drop off)
+        self.trace = deque(maxlen=trace_limit)
+        # stable step numbers, so the UI can refer to a step after older ones drop off
+        self._step_seq = itertools.count(1)
+
+        # bumped on every state change; UI caches key on (uid, version).
+        # uid, not id(): a Reset frees this mind and CPython reuses the address
+        self.uid = uuid.uuid4().hex
+        self.version = 0
+
+        # one mind is shared by every session: hold this while driving the schedule
+        self.lock = threading.RLock()
+
+    def _trace(self, entry: Dict[str, Any]):
+        entry["step"] = next(self._step_seq)
+        self.trace.append(entry)
 
     def wake(self):
         self.last = "wake"
-        self.trace.append({"phase": "wake", "room": self.schedule.current_room})
+        self._trace({"phase": "wake", "room": self.schedule.current_room})
+        # bump last: readers that see the new version must also see the new trace
+        self.version += 1
 
     def ingest_event(self, ev) -> Dict[str, Any]:
         # coherence validation
@@ -42,7 +62,8 @@ class A7DOMind:
         # if coherence fails hard, we do not ingest (prevents decoherence crash)
         if coh["score"] <= 0.25:
             self.last = "blocked"
-            self.trace.append({"phase": "blocked", "event": ev.as_prompt(), "coherence": coh})
+            self._trace({"phase": "blocked", "event": ev.as_prompt(), "coherence": coh})
+            self.version += 1
             return {"ok": False, "blocked": True, "coherence": coh}
 
         # apply movement: if event has to_room, update schedule spatial room
@@ -51,7 +72,7 @@ class A7DOMind:
             from_room = self.schedule.current_room
             self.schedule.current_room = ev.to_room
             self.schedule.spatial.room = ev.to_room
-            self.trace.append({"phase": "movement", "from": from_room, "to": ev.to_room})
+            self._trace({"phase": "movement", "from": from_room, "to": ev.to_room})
 
         # update local position if provided
         if ev.pos_xy:
@@ -66,7 +87,7 @@ class A7DOMind:
         self.lexicon.learn_from_event(ev)
 
         # observer trace
-        self.trace.append({
+        self._trace({
             "phase": "experience",
             "room": ev.room,
             "prompt": ev.as_prompt(),
@@ -86,11 +107,13 @@ class A7DOMind:
         })
 
         self.last = f"experienced in {ev.room}"
+        self.version += 1
         return {"ok": True, "coherence": coh}
 
     def sleep(self):
         self.last = "sleep"
         rep = self.sleep_engine.replay(self.experiences)
         self.last_sleep_report = rep
-        self.trace.append({"phase": "sleep", "report": rep})
+        self._trace({"phase": "sleep", "report": rep})
+        self.version += 1
         return rep
\ No newline at end of file
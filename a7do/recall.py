@@ -1,3 +1,18 @@
+OBJECT_LINE = "- {colour}{label} | state={state} | last_place={place}"
+
+
+def _object_lines(objs) -> str:
+    return "\n".join(
+        OBJECT_LINE.format(
+            colour=f"{o.colour} " if o.colour else "",
+            label=o.label,
+            state=o.state,
+            place=o.location or "unknown",
+        )
+        for o in objs
+    )
+
+
 class RecallEngine:
     def __init__(self, events, entities, objects, relationships, experiences):
         self.events = events
@@ -25,11 +40,7 @@ class RecallEngine:
         objs = self.objects.list_owned(owner_entity_id, label=label, include_gone=True)
         if not objs:
             return "None."
-        lines = []
-        for o in objs:
-            c = f"{o.colour} " if o.colour else ""
-            lines.append(f"- {c}{o.label} | state={o.state} | last_place={o.location or 'unknown'}")
-        return "\n".join(lines)
+        return _object_lines(objs)
 
     def do_i_have_object(self, owner_entity_id, label, colour=None):
         objs = self.objects.list_owned(owner_entity_id, label=label, include_gone=True)
@@ -45,11 +56,7 @@ class RecallEngine:
         objs = self.objects.list_attached_to(entity_id, include_gone=True)
         if not objs:
             return "None."
-        lines = []
-        for o in objs:
-            c = f"{o.colour} " if o.colour else ""
-            lines.append(f"- {c}{o.label} | state={o.state} | last_place={o.location or 'unknown'}")
-        return "\n".join(lines)
+        return _object_lines(objs)
 
     # ---------- experience recall ----------
     def experiences_at_place(self, place: str):
@@ -0,0 +1,30 @@
+import streamlit as st
+
+from a7do.profiles import WorldProfiles
+from a7do.schedule_engine import Schedule
+from a7do.mind import A7DOMind
+
+
+@st.cache_resource
+def get_world() -> WorldProfiles:
+    """
+    Observer-controlled world, shared by every page and session.
+    """
+    return WorldProfiles()
+
+
+@st.cache_resource
+def get_mind() -> A7DOMind:
+    """
+    One A7DO per server process.
+    Built once with its own schedule and bound to the shared world.
+    """
+    return A7DOMind(schedule=Schedule(), world=get_world())
+
+
+def get_schedule() -> Schedule:
+    """
+    The mind's schedule, not a second cache entry: clearing get_mind
+    (Reset) replaces both at once, so they can never drift apart.
+    """
+    return get_mind().schedule
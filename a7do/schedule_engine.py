@@ -1,18 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+@dataclass
+class SpatialState:
+    room: Optional[str] = None
+    pos_xy: Optional[Tuple[float, float]] = None  # position within room (0..1 normalized)
+    locomotion: str = "carried"                   # carried | crawl | walk
+
 class Schedule:
     """
     Always-present schedule.
+    Also holds where A7DO is in the HomePlot for the current day.
     """
 
     def __init__(self):
         self.day = 0
-        self.place = None
+        self.homeplot = None
+        self.current_room = None
+        self.spatial = SpatialState()
         self.events = []
         self.state = "waiting"  # waiting | awake | asleep | complete
 
-    def load_day(self, day, place, events):
+    def load_day(self, day, homeplot, start_room, events):
         self.day = day
-        self.place = place
-        self.events = events
+        self.homeplot = homeplot
+        self.current_room = start_room
+        self.spatial.room = start_room
+        # own copy: next_event() pops, the plan the events came from stays intact
+        self.events = list(events)
         self.state = "waiting"
 
     def wake(self):
@@ -27,4 +42,14 @@ class Schedule:
     def next_event(self):
         if self.events:
             return self.events.pop(0)
-        return None
\ No newline at end of file
+        return None
+
+    def status(self):
+        return {
+            "day": self.day,
+            "state": self.state,
+            "room": self.current_room,
+            "events_remaining": len(self.events),
+            "locomotion": self.spatial.locomotion,
+            "pos_xy": self.spatial.pos_xy,
+        }
\ No newline at end of file
@@ -4,24 +4,31 @@ EMOTIONS = ["happy", "sad", "excited", "angry", "calm", "scared", "nervous"]
 PLACES = ["park", "home", "garden", "vet", "beach", "gate", "street"]
 OBJECTS = ["swing", "ball", "toy", "stick", "box"]
 
+# one compiled pattern per tag (emotions/places match as substrings, objects as whole words)
+_EMOTION_RE = re.compile("|".join(map(re.escape, EMOTIONS)))
+_PLACE_RE = re.compile("|".join(map(re.escape, PLACES)))
+_OBJECT_RE = re.compile(rf"\b(?:{'|'.join(map(re.escape, OBJECTS))})\b")
+_PET_RE = re.compile("dog|pet")
+_SENSORY_RE = re.compile("smell|hear|sound")
+
 class Tagger:
     def tag(self, text: str):
         t = (text or "").lower()
         tags = set()
 
-        if any(w in t for w in EMOTIONS):
+        if _EMOTION_RE.search(t):
             tags.add("emotion")
 
-        if any(re.search(rf"\b{o}\b", t) for o in OBJECTS):
+        if _OBJECT_RE.search(t):
             tags.add("object")
 
-        if any(w in t for w in PLACES):
+        if _PLACE_RE.search(t):
             tags.add("place")
 
-        if "dog" in t or "pet" in t:
+        if _PET_RE.search(t):
             tags.add("pet")
 
-        if "smell" in t or "hear" in t or "sound" in t:
+        if _SENSORY_RE.search(t):
             tags.add("sensory")
 
-        return sorted(tags)
\ No newline at end of file
+        return sorted(tags)
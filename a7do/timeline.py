@@ -3,7 +3,7 @@ from typing import List
 from .utils import now_ts
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimelineStep:
     step: int
     phase: str           # 'thinking', 'recall', 'cross_reference', 'decision', 'mind_path'
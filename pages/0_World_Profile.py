@@ -1,13 +1,18 @@
+import pandas as pd
 import streamlit as st
-from a7do.profiles import WorldProfiles, PlaceProfile, PersonProfile, AnimalProfile, ObjectProfile
+from a7do.profiles import PlaceProfile, PersonProfile, AnimalProfile, ObjectProfile
 from a7do.homeplot import generate_default_home
+from a7do.runtime import get_world
 
 st.set_page_config(page_title="World Profile", layout="wide")
 
-if "world" not in st.session_state:
-    st.session_state.world = WorldProfiles()
+world = get_world()
+
+
+def set_home_seed():
+    # write back only when the observer edits the seed, not on every rerun
+    world.home_seed = int(st.session_state.home_seed)
 
-world = st.session_state.world
 
 st.title("🌍 World Profile (Observer-only)")
 
@@ -15,7 +20,10 @@ left, right = st.columns([1, 1])
 
 with left:
     st.subheader("Home scaffold (seeded)")
-    world.home_seed = st.number_input("Home seed", min_value=1, value=int(world.home_seed), step=1)
+    st.number_input(
+        "Home seed", min_value=1, value=int(world.home_seed), step=1,
+        key="home_seed", on_change=set_home_seed,
+    )
 
     if st.button("Generate / Regenerate HomePlot (scaffold)"):
         home = generate_default_home(int(world.home_seed))
@@ -71,16 +79,31 @@ with left:
 
 with right:
     st.subheader("Snapshot")
-    st.json(world.snapshot())
+    st.json(world.snapshot(), expanded=False)
 
     st.subheader("HomePlot preview (if generated)")
     homeplot = st.session_state.get("homeplot")
     if homeplot:
         st.write("Rooms:")
-        for rn, room in homeplot.rooms.items():
-            st.write(f"- **{rn}**: {room.width}×{room.length}m, walls={room.wall_colour}, windows={room.windows}, features={', '.join(room.features)}")
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "room": rn,
+                    "size_m": f"{room.width}×{room.length}",
+                    "walls": room.wall_colour,
+                    "windows": room.windows,
+                    "features": ", ".join(room.features),
+                }
+                for rn, room in homeplot.rooms.items()
+            ]),
+            use_container_width=True,
+            hide_index=True,
+        )
         st.write("Doors:")
-        for a, b in homeplot.doors:
-            st.write(f"- {a} ↔ {b}")
+        st.dataframe(
+            pd.DataFrame(homeplot.doors, columns=["from", "to"]),
+            use_container_width=True,
+            hide_index=True,
+        )
     else:
         st.info("No HomePlot yet. Generate one.")
\ No newline at end of file
@@ -1,15 +1,15 @@
+from itertools import islice
+
+import pandas as pd
 import streamlit as st
+from a7do.runtime import get_world, get_schedule, get_mind
 
 st.set_page_config(page_title="Observer", layout="wide")
 st.title("👁️ Observer — Learning Trace")
 
-mind = st.session_state.get("mind")
-schedule = st.session_state.get("schedule")
-world = st.session_state.get("world")
-
-if not mind or not schedule or not world:
-    st.info("Go to the main A7DO page and World Profile first.")
-    st.stop()
+mind = get_mind()
+schedule = get_schedule()
+world = get_world()
 
 c1, c2, c3, c4 = st.columns(4)
 status = schedule.status()
@@ -24,45 +24,101 @@ left, right = st.columns([1, 1])
 
 with left:
     st.subheader("Current World Lock")
-    st.write(f"Parents present: **{world.has_parents()}**")
-    st.write(f"Home generated: **{world.home_generated}**")
-    st.write(f"Locomotion: **{status['locomotion']}**")
-    st.write(f"Position (x,y): **{status['pos_xy']}**")
+    st.markdown(
+        f"Parents present: **{world.has_parents()}**\n\n"
+        f"Home generated: **{world.home_generated}**\n\n"
+        f"Locomotion: **{status['locomotion']}**\n\n"
+        f"Position (x,y): **{status['pos_xy']}**"
+    )
 
     st.subheader("Lexicon (exposure counts)")
-    st.json(mind.lexicon.snapshot())
+    st.json(mind.lexicon.snapshot(), expanded=False)
 
 with right:
     st.subheader("Latest Coherence Check")
-    st.json(mind.last_coherence or {"note": "no coherence run yet"})
+    st.json(mind.last_coherence or {"note": "no coherence run yet"}, expanded=False)
 
     st.subheader("Latest Sleep Report")
-    st.json(mind.last_sleep_report or {"note": "no sleep yet"})
+    rep = mind.last_sleep_report
+    if not rep:
+        st.info("No sleep yet.")
+    else:
+        st.caption(f"Replayed {rep['replayed_count']} experiences — {rep['note']}")
+        st.dataframe(pd.DataFrame(rep["top_edges"]), use_container_width=True, hide_index=True)
 
 st.divider()
 st.subheader("Learning Trace (what was shown → how structure formed)")
 
-trace = mind.trace[-60:]
-if not trace:
+def trace_summary(t) -> str:
+    phase = t.get("phase")
+    if phase == "experience":
+        return t.get("prompt", "—")
+    if phase == "movement":
+        return f"{t.get('from')} → {t.get('to')}"
+    if phase == "blocked":
+        return t.get("event", "—")
+    if phase == "sleep":
+        return f"replayed {t.get('report', {}).get('replayed_count', 0)}"
+    return t.get("room") or "—"
+
+
+@st.fragment
+def trace_inspector(recent):
+    """
+    Picking a step reruns only this block, not the metrics, lexicon and table above.
+    """
+    # options are step numbers, not window positions: a selection keeps
+    # pointing at the same step as new ones arrive and old ones drop off
+    by_step = {t["step"]: t for t in recent}
+    steps = list(by_step)
+    # remembered per mind: step numbers restart after a Reset
+    prev_uid, prev = st.session_state.get("_trace_pick", (None, None))
+    pick = st.selectbox(
+        "Inspect step",
+        steps,
+        index=steps.index(prev) if prev_uid == mind.uid and prev in by_step else 0,
+        format_func=lambda n: f"#{n} {by_step[n].get('phase')} — {trace_summary(by_step[n])}",
+    )
+    st.session_state["_trace_pick"] = (mind.uid, pick)
+    t = by_step[pick]
+    phase = t.get("phase")
+    if phase == "experience":
+        st.markdown(f"### EXPERIENCE @ {t.get('room')}")
+        st.code(t.get("prompt", "—"))
+        st.json(t.get("event", {}), expanded=False)
+        st.json({"coherence": t.get("coherence", {})}, expanded=False)
+    elif phase == "movement":
+        st.markdown("### MOVEMENT (inferred from place change)")
+        st.write(f"From **{t.get('from')}** → **{t.get('to')}**")
+    elif phase == "blocked":
+        st.markdown("### BLOCKED (decoherence protection)")
+        st.code(t.get("event", "—"))
+        st.json(t.get("coherence", {}), expanded=False)
+    elif phase == "sleep":
+        st.markdown("### SLEEP (replay stats)")
+        st.json(t.get("report", {}), expanded=False)
+    else:
+        st.markdown(f"### {phase.upper()}")
+        st.json(t, expanded=False)
+
+
+# sample the version before the trace: a concurrent append can then only
+# make the cached frame look stale (rebuilt next run), never newer than it is
+trace_version = mind.version
+# newest first, last 60 steps only
+recent = list(islice(reversed(mind.trace), 60))
+if not recent:
     st.info("No trace yet. Wake A7DO and step events.")
 else:
-    for t in trace[::-1]:
-        phase = t.get("phase")
-        if phase == "experience":
-            st.markdown(f"### EXPERIENCE @ {t.get('room')}")
-            st.code(t.get("prompt", "—"))
-            st.json(t.get("event", {}))
-            st.json({"coherence": t.get("coherence", {})})
-        elif phase == "movement":
-            st.markdown("### MOVEMENT (inferred from place change)")
-            st.write(f"From **{t.get('from')}** → **{t.get('to')}**")
-        elif phase == "blocked":
-            st.markdown("### BLOCKED (decoherence protection)")
-            st.code(t.get("event", "—"))
-            st.json(t.get("coherence", {}))
-        elif phase == "sleep":
-            st.markdown("### SLEEP (replay stats)")
-            st.json(t.get("report", {}))
-        else:
-            st.markdown(f"### {phase.upper()}")
-            st.json(t)
\ No newline at end of file
+    # one table for the window, full detail for the selected step only;
+    # the trace only changes when the mind version does, so keep the frame per session
+    trace_key = (mind.uid, trace_version)
+    if st.session_state.get("_trace_df_key") != trace_key:
+        st.session_state["_trace_df"] = pd.DataFrame([
+            {"#": t["step"], "phase": t.get("phase"), "room": t.get("room", ""), "summary": trace_summary(t)}
+            for t in recent
+        ])
+        st.session_state["_trace_df_key"] = trace_key
+    st.dataframe(st.session_state["_trace_df"], use_container_width=True, hide_index=True)
+
+    trace_inspector(recent)
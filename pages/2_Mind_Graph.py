@@ -1,16 +1,48 @@
+import json
+
 import streamlit as st
-import networkx as nx
-import matplotlib.pyplot as plt
+import streamlit.components.v1 as components
+from a7do.runtime import get_mind
 
 st.set_page_config(page_title="A7DO Mind Graph", layout="wide")
 
 st.title("🧠 A7DO Mind Graph")
 
-mind = st.session_state.get("mind")
-
-if not mind:
-    st.info("Mind not initialised yet.")
-    st.stop()
+TYPE_COLOR = {
+    "person": "#7dafff",
+    "pet": "#9aff7d",
+    "object": "#ffd27d",
+    "place": "#ff9a9a",
+    "event": "#cccccc",
+}
+DEFAULT_COLOR = "#dddddd"
+
+GRAPH_HEIGHT = 900
+
+VIS_TEMPLATE = """<!doctype html>
+<html>
+<head>
+<script src="https://unpkg.com/vis-network@9.1.9/standalone/umd/vis-network.min.js"></script>
+<style>html, body, #mind { margin: 0; height: 100%; }</style>
+</head>
+<body>
+<div id="mind"></div>
+<script>
+var data = {{DATA}};
+var options = {
+  nodes: { shape: "dot", size: 22, font: { size: 13 }, borderWidth: 1 },
+  edges: { font: { size: 10, align: "middle" }, color: "#888888", smooth: false },
+  physics: { solver: "barnesHut", stabilization: { iterations: 200 } }
+};
+new vis.Network(document.getElementById("mind"), data, options);
+</script>
+</body>
+</html>
+"""
+
+mind = get_mind()
+# sampled before the data is read, so a cached graph is never newer than its key
+mind_version = mind.version
 
 
 # -------------------------
@@ -18,8 +50,9 @@ if not mind:
 # -------------------------
 
 def safe_events():
-    evs = getattr(mind.events, "events", [])
+    evs = getattr(getattr(mind, "events", None), "events", [])
     if isinstance(evs, dict):
+        # snapshot: the mind is shared, another session may ingest mid-render
         return list(evs.values())
     if isinstance(evs, list):
         return evs
@@ -27,101 +60,95 @@ def safe_events():
 
 
 def safe_entities():
-    return getattr(mind.bridge, "entities", {})
+    return getattr(getattr(mind, "bridge", None), "entities", {})
 
 
 def safe_relationships():
-    return getattr(mind.bridge, "relationships", [])
-
-
-# -------------------------
-# Build Graph
-# -------------------------
+    return getattr(getattr(mind, "bridge", None), "relationships", [])
 
-G = nx.Graph()
 
-# --- Entities ---
 entities = safe_entities()
-for eid, ent in entities.items():
-    label = f"{ent.name}\n({ent.kind})"
-    G.add_node(eid, label=label, type=ent.kind)
-
-
-# --- Relationships ---
-for rel in safe_relationships():
-    G.add_edge(
-        rel.source,
-        rel.target,
-        label=rel.relation
-    )
-
-
-# --- Events ---
+relationships = safe_relationships()
 events = safe_events()
 
-for idx, ev in enumerate(events):
-    # Stable fallback ID
-    ev_id = f"event_{idx}"
-
-    G.add_node(ev_id, label="Event", type="event")
 
-    # Link entities
-    for ent_id in getattr(ev, "entities", []):
-        if ent_id in G:
-            G.add_edge(ent_id, ev_id, label="experienced")
-
-    # Link objects
-    for obj_id in getattr(ev, "objects", []):
-        if obj_id in G:
-            G.add_edge(obj_id, ev_id, label="involved")
+# -------------------------
+# Build Graph
+# -------------------------
 
-    # Link places
-    for place_id in getattr(ev, "places", []):
-        if place_id in G:
-            G.add_edge(place_id, ev_id, label="at")
+@st.cache_data(show_spinner=False)
+def build_graph_html(fingerprint: tuple) -> str:
+    """
+    vis-network page for the current mind state ("" when empty).
+    Keyed on the mind fingerprint only; the graph itself is read from the shared mind.
+    """
+    nodes = {}
+    edges = []
+
+    def add_node(node_id, label, kind):
+        nodes[node_id] = {
+            "id": node_id,
+            "label": label,
+            "color": {"background": TYPE_COLOR.get(kind, DEFAULT_COLOR), "border": "#000000"},
+        }
+
+    # --- Entities ---
+    for eid, ent in entities.items():
+        add_node(eid, f"{ent.name}\n({ent.kind})", ent.kind)
+
+    # --- Relationships ---
+    for rel in relationships:
+        for end in (rel.source, rel.target):
+            if end not in nodes:
+                add_node(end, "", "")
+        edges.append({"from": rel.source, "to": rel.target, "label": rel.relation})
+
+    # --- Events ---
+    for idx, ev in enumerate(events):
+        # Stable fallback ID
+        ev_id = f"event_{idx}"
+
+        add_node(ev_id, "Event", "event")
+
+        # Link entities
+        for ent_id in getattr(ev, "entities", []):
+            if ent_id in nodes:
+                edges.append({"from": ent_id, "to": ev_id, "label": "experienced"})
+
+        # Link objects
+        for obj_id in getattr(ev, "objects", []):
+            if obj_id in nodes:
+                edges.append({"from": obj_id, "to": ev_id, "label": "involved"})
+
+        # Link places
+        for place_id in getattr(ev, "places", []):
+            if place_id in nodes:
+                edges.append({"from": place_id, "to": ev_id, "label": "at"})
+
+    if not nodes:
+        return ""
+
+    # json.dumps leaves "</" alone; escape "<" so a label cannot close the <script>
+    data = json.dumps({"nodes": list(nodes.values()), "edges": edges}).replace("<", "\\u003c")
+    return VIS_TEMPLATE.replace("{{DATA}}", data)
 
 
 # -------------------------
 # Draw Graph
 # -------------------------
 
-if len(G.nodes) == 0:
+graph_sig = (mind.uid, mind_version, len(entities), len(relationships), len(events))
+
+# per-session fast path: skip even the cache lookup when nothing changed
+if graph_sig == st.session_state.get("_mind_graph_sig"):
+    html = st.session_state["_mind_graph_html"]
+else:
+    html = build_graph_html(graph_sig)
+    st.session_state["_mind_graph_sig"] = graph_sig
+    st.session_state["_mind_graph_html"] = html
+
+if not html:
     st.info("No entities or events to display yet.")
     st.stop()
 
-pos = nx.spring_layout(G, seed=42, k=1.1)
-
-plt.figure(figsize=(14, 14))
-
-node_colors = []
-for _, data in G.nodes(data=True):
-    t = data.get("type", "")
-    if t == "person":
-        node_colors.append("#7dafff")
-    elif t == "pet":
-        node_colors.append("#9aff7d")
-    elif t == "object":
-        node_colors.append("#ffd27d")
-    elif t == "place":
-        node_colors.append("#ff9a9a")
-    elif t == "event":
-        node_colors.append("#cccccc")
-    else:
-        node_colors.append("#dddddd")
-
-nx.draw(
-    G,
-    pos,
-    with_labels=False,
-    node_size=2000,
-    node_color=node_colors,
-    edgecolors="black"
-)
-
-labels = nx.get_node_attributes(G, "label")
-nx.draw_networkx_labels(G, pos, labels, font_size=9)
-
-edge_labels = nx.get_edge_attributes(G, "label")
-nx.draw_networkx_edge_labels(G, pos, edge_labels, font_size=8)
-
-st.pyplot(plt)
\ No newline at end of file
+components.html(html, height=GRAPH_HEIGHT)